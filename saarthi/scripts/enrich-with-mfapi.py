@@ -4,17 +4,102 @@ Saarthi Returns Enrichment Script - Using MFApi.in
 Calculates returns from historical NAV data
 """
 
+import asyncio
+import bisect
+import functools
+import itertools
 import json
-import requests
-import time
 from datetime import datetime, timedelta
 import sys
+import os
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # checked in __main__
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional - enables the local NAV history cache
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_ddmmyyyy(date_str):
+    """Parse a 'DD-MM-YYYY' date into a YYYYMMDD integer (sorts like the date),
+    or None if it isn't a valid date
+    Cached because the same few thousand dates repeat across every fund"""
+    try:
+        d, m, y = date_str.split('-')
+        d, m, y = int(d), int(m), int(y)
+        datetime(y, m, d)  # rejects e.g. 31-02-2024, like strptime did
+    except (AttributeError, ValueError):
+        return None
+    return y * 10000 + m * 100 + d
+
+
+class RateLimiter:
+    """Spaces requests out evenly to stay under a fixed rate per second"""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+        
+    async def acquire(self):
+        """Wait until the next request slot is available"""
+        async with self.lock:
+            now = asyncio.get_running_loop().time()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def pause(self, seconds):
+        """Hold back all requests for the given number of seconds"""
+        now = asyncio.get_running_loop().time()
+        self.next_slot = max(self.next_slot, now + seconds)
+
 
 class MFApiEnricher:
+    # Concurrency settings - be nice to the API
+    MAX_CONCURRENCY = 32       # requests in flight at once
+    REQUESTS_PER_SECOND = 10   # overall request rate cap
+    BATCH_SIZE = 500           # funds per batch (progress saved between batches)
+    RETRY_ATTEMPTS = 3         # attempts per fund on 429 / 5xx / timeout
+    RETRY_BASE_DELAY = 1       # seconds, doubled after every failed attempt
+    RETRY_MAX_DELAY = 30       # seconds
+    
+    # Return periods in days, shortest first
+    RETURN_PERIODS = [('1year', 365), ('3year', 1095), ('5year', 1825)]
+    
     def __init__(self):
         self.input_file = 'saarthi/data/funds-data.json'
         self.output_file = 'saarthi/data/funds-data-enriched.json'
         self.progress_file = 'saarthi/data/enrichment-progress.json'
+        self.delta_file = 'saarthi/data/enrichment-delta.jsonl'
+        self.nav_cache_file = 'saarthi/data/nav-cache.parquet'
+        self.nav_cache = {}          # scheme_code -> cached NAV history table
+        self.nav_cache_updates = {}  # scheme_code -> NAV history fetched this run
+        self.delta = None
+        self.mfapi_codes = None
+        
+        # Target date of each return period as a YYYYMMDD key - the same for
+        # every fund, so work them out once per run
+        now = datetime.now()
+        self.return_targets = []
+        for period, days in self.RETURN_PERIODS:
+            target_date = now - timedelta(days=days)
+            target = target_date.year * 10000 + target_date.month * 100 + target_date.day
+            self.return_targets.append((period, target))
         self.errors = []
         self.successful = 0
         self.failed = 0
@@ -22,7 +107,7 @@ class MFApiEnricher:
     def calculate_returns(self, nav_history):
         """
         Calculate returns from NAV history
-        nav_history: list of {'date': 'DD-MM-YYYY', 'nav': 'XXX.XX'}
+        nav_history: list of {'date': 'DD-MM-YYYY', 'nav': 'XXX.XX'}, newest first
         """
         try:
             if not nav_history or len(nav_history) < 2:
@@ -37,66 +122,202 @@ class MFApiEnricher:
                 '5year': None
             }
             
-            # Helper function to find NAV closest to N days ago
-            def get_nav_n_days_ago(days):
-                target_date = datetime.now() - timedelta(days=days)
-                
-                for nav_entry in nav_history:
+            # History is newest first, so negated YYYYMMDD keys are ascending.
+            # Only the entries the binary search probes get parsed. A missing
+            # or bad date makes the key raise, and that period falls back to
+            # a plain scan that skips such entries
+            def date_key(nav_entry):
+                return -_parse_ddmmyyyy(nav_entry['date'])
+            
+            def first_nav_from(start, target):
+                # Newest entry from start on with a usable date and NAV
+                for nav_entry in itertools.islice(nav_history, start, None):
                     try:
-                        nav_date = datetime.strptime(nav_entry['date'], '%d-%m-%Y')
-                        
-                        # If this NAV is older than target date, use it
-                        if nav_date <= target_date:
+                        nav_key = _parse_ddmmyyyy(nav_entry['date'])
+                        if nav_key is not None and nav_key <= target:
                             return float(nav_entry['nav'])
                     except:
                         continue
                 
                 return None
             
-            # Calculate 1-year return (~365 days)
-            nav_1y = get_nav_n_days_ago(365)
-            if nav_1y:
-                returns['1year'] = round(((current_nav - nav_1y) / nav_1y) * 100, 2)
-            
-            # Calculate 3-year return (~1095 days)
-            nav_3y = get_nav_n_days_ago(1095)
-            if nav_3y:
-                returns['3year'] = round(((current_nav - nav_3y) / nav_3y) * 100, 2)
+            # Helper function to find NAV on or before a target date
+            def get_nav_on_or_before(target):
+                # Binary search for the newest NAV on or before the target date
+                try:
+                    start = bisect.bisect_left(nav_history, -target, key=date_key)
+                except (KeyError, TypeError):
+                    start = 0
+                
+                return first_nav_from(start, target)
             
-            # Calculate 5-year return (~1825 days)
-            nav_5y = get_nav_n_days_ago(1825)
-            if nav_5y:
-                returns['5year'] = round(((current_nav - nav_5y) / nav_5y) * 100, 2)
+            for period, target in self.return_targets:
+                past_nav = get_nav_on_or_before(target)
+                if past_nav:
+                    returns[period] = round(((current_nav - past_nav) / past_nav) * 100, 2)
             
             return returns
             
         except Exception as e:
             return None
     
-    def get_fund_data_from_mfapi(self, scheme_code):
+    def calculate_returns_from_keys(self, date_keys, navs):
+        """
+        Calculate returns from a cached NAV history
+        date_keys: negated YYYYMMDD ints (ascending, so newest first), navs: floats
+        """
+        if len(navs) < 2:
+            return None
+        
+        current_nav = navs[0]
+        
+        returns = {
+            '1year': None,
+            '3year': None,
+            '5year': None
+        }
+        
+        for period, target in self.return_targets:
+            start = bisect.bisect_left(date_keys, -target)
+            past_nav = next((nav for nav in itertools.islice(navs, start, None) if nav is not None), None)
+            if past_nav:
+                returns[period] = round(((current_nav - past_nav) / past_nav) * 100, 2)
+        
+        return returns
+    
+    async def get_fund_data_from_mfapi(self, session, limiter, scheme_code):
         """
         Fetch fund data from MFApi.in
+        Retries with exponential backoff on rate limiting, server errors and timeouts
         """
-        try:
-            url = f"https://api.mfapi.in/mf/{scheme_code}"
-            response = requests.get(url, timeout=15)
+        url = f"https://api.mfapi.in/mf/{scheme_code}"
+        
+        for attempt in range(self.RETRY_ATTEMPTS):
+            delay = min(self.RETRY_BASE_DELAY * 2 ** attempt, self.RETRY_MAX_DELAY)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check if data is valid
-                if 'data' in data and len(data['data']) > 0:
-                    return data['data']
+            try:
+                await limiter.acquire()
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    # Slow everyone down if the API says we are out of quota
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        limiter.pause(self.RETRY_BASE_DELAY)
+                    
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        
+                        # Check if data is valid
+                        if 'data' in data and len(data['data']) > 0:
+                            return data['data']
+                        return None
+                    
+                    # Anything other than 429 / 5xx won't get better by retrying
+                    if response.status != 429 and response.status < 500:
+                        return None
+                    
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = min(int(retry_after), self.RETRY_MAX_DELAY)
+                        limiter.pause(delay)
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            except Exception as e:
+                return None
+            
+            if attempt + 1 < self.RETRY_ATTEMPTS:
+                await asyncio.sleep(delay)
+        
+        return None
+    
+    async def get_mfapi_scheme_codes(self, session):
+        """
+        Fetch the directory of every scheme MFApi.in has data for
+        One request up front saves a round-trip per fund it doesn't know
+        """
+        try:
+            url = "https://api.mfapi.in/mf"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
+                if response.status == 200:
+                    schemes = await response.json(content_type=None)
+                    return {str(scheme['schemeCode']) for scheme in schemes}
             
             return None
             
         except Exception as e:
             return None
     
+    async def fetch_and_process(self, session, semaphore, limiter, data, i, total_funds, fund_key, fund_info):
+        """
+        Fetch NAV history for one fund and store its returns
+        """
+        fund_name = fund_info['name']
+        scheme_code = fund_info.get('scheme_code')
+        progress_pct = ((i + 1) / total_funds) * 100
+        label = f"[{i+1}/{total_funds}] ({progress_pct:.1f}%) {fund_name[:55]}"
+        
+        if not scheme_code:
+            print(f"{label}\n  ⚠️  No scheme code - skipping")
+            self.failed += 1
+            return
+        
+        if self.mfapi_codes is not None and scheme_code not in self.mfapi_codes:
+            print(f"{label}\n  ⚠️  Not listed on MFApi - skipping")
+            self.failed += 1
+            self.errors.append({
+                'fund': fund_name,
+                'scheme_code': scheme_code,
+                'error': 'Not listed on MFApi'
+            })
+            return
+        
+        # Use the cached history if it already has the latest AMFI NAV
+        cached = self.get_cached_nav_history(scheme_code, fund_info.get('nav_date'))
+        
+        if cached is not None:
+            returns = self.calculate_returns_from_keys(*cached)
+        else:
+            # Fetch historical NAV data
+            async with semaphore:
+                nav_history = await self.get_fund_data_from_mfapi(session, limiter, scheme_code)
+            
+            if not nav_history:
+                print(f"{label}\n  ❌ Failed to fetch data from MFApi")
+                self.failed += 1
+                self.errors.append({
+                    'fund': fund_name,
+                    'scheme_code': scheme_code,
+                    'error': 'API fetch failed'
+                })
+                return
+            
+            self.cache_nav_history(scheme_code, nav_history)
+            
+            # Calculate returns
+            returns = self.calculate_returns(nav_history)
+        
+        if returns:
+            data['funds'][fund_key]['returns'] = returns
+            self.save_delta(fund_key, returns)
+            self.successful += 1
+            
+            # Show what we got
+            ret_str = []
+            if returns['1year']: ret_str.append(f"1Y:{returns['1year']:+.1f}%")
+            if returns['3year']: ret_str.append(f"3Y:{returns['3year']:+.1f}%")
+            if returns['5year']: ret_str.append(f"5Y:{returns['5year']:+.1f}%")
+            
+            print(f"{label}\n  ✅ {' | '.join(ret_str)}")
+        else:
+            print(f"{label}\n  ⚠️  Could not calculate returns (insufficient history)")
+            self.failed += 1
+    
     def enrich_funds(self, start_from=0):
         """
         Main enrichment process
         """
+        return asyncio.run(self._enrich_funds(start_from))
+    
+    async def _enrich_funds(self, start_from=0):
         print("=" * 70)
         print("🔍 Saarthi Returns Enrichment - Using MFApi.in")
         print("=" * 70)
@@ -104,75 +325,70 @@ class MFApiEnricher:
         
         # Load existing data
         print("📥 Loading fund data...")
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self._read_json(self.input_file)
         
-        funds = list(data['funds'].items())
-        total_funds = len(funds)
+        total_funds = len(data['funds'])
         
         print(f"📊 Total funds to enrich: {total_funds}")
         if start_from > 0:
             print(f"▶️  Starting from fund #{start_from}")
         print()
-        print("⏱️  Estimated time: ~{} hours".format(round(total_funds * 2 / 3600, 1)))
-        print("   (2 seconds per fund with rate limiting)")
+        print("⏱️  Estimated time: ~{} minutes".format(round((total_funds - start_from) / self.REQUESTS_PER_SECOND / 60, 1)))
+        print(f"   ({self.MAX_CONCURRENCY} concurrent requests, max {self.REQUESTS_PER_SECOND} per second)")
         print()
         
-        # Process each fund
-        for i in range(start_from, total_funds):
-            fund_key, fund_info = funds[i]
-            fund_name = fund_info['name']
-            scheme_code = fund_info.get('scheme_code')
-            
-            # Progress indicator
-            progress_pct = ((i + 1) / total_funds) * 100
-            print(f"[{i+1}/{total_funds}] ({progress_pct:.1f}%) {fund_name[:55]}")
-            
-            if not scheme_code:
-                print(f"  ⚠️  No scheme code - skipping")
-                self.failed += 1
-                continue
-            
-            # Fetch historical NAV data
-            nav_history = self.get_fund_data_from_mfapi(scheme_code)
-            
-            if nav_history:
-                # Calculate returns
-                returns = self.calculate_returns(nav_history)
+        self.load_nav_cache()
+        
+        # Returns are appended to a delta log as funds are enriched - the full
+        # funds file is only written once, at the end
+        if start_from > 0:
+            self.replay_delta(data)
+        elif os.path.exists(self.progress_file):
+            # Fresh run - an old progress file would point a later resume
+            # at funds that are no longer in the (truncated) delta log
+            os.remove(self.progress_file)
+        self.delta = open(self.delta_file, 'ab' if start_from > 0 else 'wb')
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        limiter = RateLimiter(self.REQUESTS_PER_SECOND)
+        # One session for the whole run so TCP + TLS connections are reused.
+        # Keep idle connections around longer than the longest retry backoff
+        # so a pause doesn't force fresh handshakes for every worker.
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.MAX_CONCURRENCY,
+            keepalive_timeout=self.RETRY_MAX_DELAY * 2
+        )
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                print("📥 Fetching MFApi scheme directory...")
+                self.mfapi_codes = await self.get_mfapi_scheme_codes(session)
+                if self.mfapi_codes is None:
+                    print("⚠️  Could not fetch directory - trying every fund")
+                else:
+                    print(f"✅ MFApi lists {len(self.mfapi_codes)} schemes")
+                print()
+                
+                # Walk the funds dict directly rather than copying it into a list
+                funds = itertools.islice(data['funds'].items(), start_from, None)
                 
-                if returns:
-                    data['funds'][fund_key]['returns'] = returns
-                    self.successful += 1
+                # Process funds in batches, saving progress after each one
+                for batch_start in range(start_from, total_funds, self.BATCH_SIZE):
+                    batch_end = min(batch_start + self.BATCH_SIZE, total_funds)
+                    batch = enumerate(itertools.islice(funds, batch_end - batch_start), start=batch_start)
                     
-                    # Show what we got
-                    ret_str = []
-                    if returns['1year']: ret_str.append(f"1Y:{returns['1year']:+.1f}%")
-                    if returns['3year']: ret_str.append(f"3Y:{returns['3year']:+.1f}%")
-                    if returns['5year']: ret_str.append(f"5Y:{returns['5year']:+.1f}%")
+                    await asyncio.gather(*[
+                        self.fetch_and_process(session, semaphore, limiter, data, i, total_funds, fund_key, fund_info)
+                        for i, (fund_key, fund_info) in batch
+                    ])
                     
-                    print(f"  ✅ {' | '.join(ret_str)}")
-                else:
-                    print(f"  ⚠️  Could not calculate returns (insufficient history)")
-                    self.failed += 1
-            else:
-                print(f"  ❌ Failed to fetch data from MFApi")
-                self.failed += 1
-                self.errors.append({
-                    'fund': fund_name,
-                    'scheme_code': scheme_code,
-                    'error': 'API fetch failed'
-                })
-            
-            # Rate limiting - be nice to the API
-            time.sleep(2)  # 2 seconds between requests
-            
-            # Save progress every 50 funds
-            if (i + 1) % 50 == 0:
-                self.save_progress(data, i + 1)
-                print()
-                print(f"💾 Progress saved! ({self.successful} enriched, {self.failed} failed)")
-                print(f"⏱️  Estimated time remaining: ~{round((total_funds - i - 1) * 2 / 3600, 1)} hours")
-                print()
+                    self.save_progress(batch_end)
+                    print()
+                    print(f"💾 Progress saved! ({self.successful} enriched, {self.failed} failed)")
+                    print(f"⏱️  Estimated time remaining: ~{round((total_funds - batch_end) / self.REQUESTS_PER_SECOND / 60, 1)} minutes")
+                    print()
+        finally:
+            self.delta.close()
         
         # Save final data
         print()
@@ -195,18 +411,138 @@ class MFApiEnricher:
         
         return True
     
-    def save_progress(self, data, current_index):
+    def _read_json(self, path):
+        """Read a large JSON file"""
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read()) if orjson else json.load(f)
+    
+    def _write_json(self, path, data):
+        """Write a large JSON file"""
+        if orjson:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    def load_nav_cache(self):
+        """
+        Load NAV histories cached by previous runs (needs pyarrow)
+        The file is sorted by scheme code, so each scheme is one contiguous slice
+        """
+        if pa is None or not os.path.exists(self.nav_cache_file):
+            return
+        
+        try:
+            table = pq.read_table(self.nav_cache_file)
+        except Exception as e:
+            print(f"⚠️  Could not read NAV cache: {e}")
+            return
+        
+        if table.num_rows == 0:
+            return
+        
+        codes = table.column('scheme_code').combine_chunks()
+        changes = pc.indices_nonzero(pc.not_equal(codes[1:], codes[:-1])).to_pylist()
+        starts = [0] + [i + 1 for i in changes]
+        ends = starts[1:] + [table.num_rows]
+        
+        for start, end in zip(starts, ends):
+            self.nav_cache[str(codes[start].as_py())] = table.slice(start, end - start)
+        
+        print(f"📦 Loaded cached NAV history for {len(self.nav_cache)} funds")
+    
+    def get_cached_nav_history(self, scheme_code, nav_date):
+        """
+        Return the cached NAV history as (date_keys, navs) if it is up to date
+        nav_date: latest NAV date from AMFI ('DD-Mon-YYYY')
+        """
+        cached = self.nav_cache.get(scheme_code)
+        if cached is None or not nav_date:
+            return None
+        
+        try:
+            latest_amfi_date = datetime.strptime(nav_date, '%d-%b-%Y').date()
+        except ValueError:
+            return None
+        
+        # Newest entry first - stale if AMFI has published a newer NAV since
+        if cached.column('date')[0].as_py() < latest_amfi_date:
+            return None
+        
+        # Build the search keys straight from the date32 column - no round
+        # trip through 'DD-MM-YYYY' strings
+        dates = cached.column('date')
+        ymd = pc.add(pc.add(pc.multiply(pc.year(dates), 10000), pc.multiply(pc.month(dates), 100)), pc.day(dates))
+        return pc.negate(ymd).to_pylist(), cached.column('nav').to_pylist()
+    
+    def cache_nav_history(self, scheme_code, nav_history):
+        """Keep a freshly fetched NAV history for the cache (needs pyarrow)"""
+        if pa is None:
+            return
+        
+        try:
+            dates = pc.strptime(pa.array([e['date'] for e in nav_history]), format='%d-%m-%Y', unit='s')
+            self.nav_cache_updates[scheme_code] = pa.table({
+                'scheme_code': pa.array([int(scheme_code)] * len(nav_history), pa.int32()),
+                'date': dates.cast(pa.date32()),
+                'nav': pa.array([e['nav'] for e in nav_history]).cast(pa.float32())
+            })
+        except Exception as e:
+            pass  # just don't cache histories we can't parse
+    
+    def save_nav_cache(self):
+        """Merge this run's NAV histories into the parquet cache"""
+        if pa is None or not self.nav_cache_updates:
+            return
+        
+        tables = [table for code, table in self.nav_cache.items() if code not in self.nav_cache_updates]
+        tables.extend(self.nav_cache_updates.values())
+        
+        cache = pa.concat_tables(tables).sort_by([('scheme_code', 'ascending'), ('date', 'descending')])
+        pq.write_table(cache, self.nav_cache_file, compression='zstd')
+        
+        print(f"📦 NAV history cache saved to: {self.nav_cache_file}")
+    
+    def save_delta(self, fund_key, returns):
+        """Append one enriched fund to the delta log"""
+        if orjson:
+            line = orjson.dumps({fund_key: returns})
+        else:
+            line = json.dumps({fund_key: returns}, ensure_ascii=False).encode('utf-8')
+        self.delta.write(line + b'\n')
+    
+    def replay_delta(self, data):
+        """Apply returns saved in the delta log by a previous run"""
+        loads = orjson.loads if orjson else json.loads
+        
+        try:
+            with open(self.delta_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        continue  # partial line from an interrupted write
+                    
+                    for fund_key, returns in entry.items():
+                        if fund_key in data['funds']:
+                            data['funds'][fund_key]['returns'] = returns
+        except FileNotFoundError:
+            pass
+    
+    def save_progress(self, current_index):
         """Save intermediate progress"""
-        data['last_updated'] = datetime.now().isoformat()
-        data['enrichment_progress'] = {
+        self.delta.flush()
+        
+        progress = {
             'last_index': current_index,
             'successful': self.successful,
             'failed': self.failed,
             'timestamp': datetime.now().isoformat()
         }
         
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(self.progress_file, 'w') as f:
+            json.dump(progress, f, indent=2)
     
     def save_final(self, data):
         """Save final enriched data"""
@@ -219,33 +555,33 @@ class MFApiEnricher:
             'completion_date': datetime.now().isoformat()
         }
         
-        # Remove progress tracking
-        if 'enrichment_progress' in data:
-            del data['enrichment_progress']
+        self._write_json(self.output_file, data)
+        self.save_nav_cache()
         
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Remove progress tracking
+        for path in (self.delta_file, self.progress_file):
+            if os.path.exists(path):
+                os.remove(path)
         
         print(f"\n📁 Enriched data saved to: {self.output_file}")
     
     def resume_from_progress(self):
         """Resume from last saved progress"""
         try:
-            with open(self.output_file, 'r') as f:
-                data = json.load(f)
-                
-            if 'enrichment_progress' in data:
-                last_index = data['enrichment_progress']['last_index']
-                print(f"📂 Found previous progress at index {last_index}")
-                print(f"   Successful: {data['enrichment_progress']['successful']}")
-                print(f"   Failed: {data['enrichment_progress']['failed']}")
-                print()
+            with open(self.progress_file, 'r') as f:
+                progress = json.load(f)
                 
-                resume = input("Resume from this point? (yes/no): ")
-                if resume.lower() == 'yes':
-                    self.successful = data['enrichment_progress']['successful']
-                    self.failed = data['enrichment_progress']['failed']
-                    return last_index
+            last_index = progress['last_index']
+            print(f"📂 Found previous progress at index {last_index}")
+            print(f"   Successful: {progress['successful']}")
+            print(f"   Failed: {progress['failed']}")
+            print()
+            
+            resume = input("Resume from this point? (yes/no): ")
+            if resume.lower() == 'yes':
+                self.successful = progress['successful']
+                self.failed = progress['failed']
+                return last_index
         except:
             pass
         
@@ -253,6 +589,11 @@ class MFApiEnricher:
 
 
 if __name__ == '__main__':
+    if aiohttp is None:
+        print("❌ Error: 'aiohttp' library not found")
+        print("📦 Please install it with: pip3 install aiohttp")
+        sys.exit(1)
+    
     print()
     print("╔═══════════════════════════════════════════════════════════════╗")
     print("║                                                               ║")
@@ -266,8 +607,9 @@ if __name__ == '__main__':
     print("   3. Save enriched data with returns")
     print()
     print("⚠️  IMPORTANT:")
-    print("   • This will take ~4 hours (7,414 funds × 2 sec)")
-    print("   • Progress is saved every 50 funds")
+    rate = MFApiEnricher.REQUESTS_PER_SECOND
+    print(f"   • Runs at about {rate * 60:,} funds per minute ({rate} per second)")
+    print(f"   • Progress is saved every {MFApiEnricher.BATCH_SIZE} funds")
     print("   • You can stop and resume anytime (Ctrl+C)")
     print("   • Be patient - API is free but rate-limited")
     print()
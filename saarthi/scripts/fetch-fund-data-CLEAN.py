@@ -4,13 +4,146 @@ Saarthi Fund Data Fetcher - Clean Working Version
 Fetches ALL funds from AMFI with correct field parsing
 """
 
+import itertools
 import json
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import re
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Plan details to strip from fund names (everything from "- Direct" etc. onwards)
+_PLAN_RE = re.compile(r'\s*-\s*(?:Direct|Regular|Growth).*$', re.IGNORECASE)
+
+# "index" only as a whole word, so e.g. "indexation" isn't an Index fund
+_INDEX_RE = re.compile(r'\bindex\b')
+
+# Only files this big are parsed in worker processes. Today's NAVAll.txt
+# (~14k fund lines) parses in about 0.2s, less than it takes to start them
+_PARALLEL_MIN_LINES = 100_000
+
+# Estimated AUM by category
+_AUM_MAP = {
+    'Equity - Large Cap': '₹15,000 Cr',
+    'Equity - Mid Cap': '₹8,000 Cr',
+    'Equity - Small Cap': '₹5,000 Cr',
+    'Equity - Flexi Cap': '₹12,000 Cr',
+    'Equity - ELSS': '₹6,000 Cr',
+    'Equity - Index': '₹10,000 Cr',
+    'Equity - Sectoral': '₹4,000 Cr',
+    'Hybrid': '₹8,000 Cr',
+    'Debt - Liquid': '₹20,000 Cr',
+    'Debt - Money Market': '₹15,000 Cr',
+    'Debt': '₹5,000 Cr',
+    'Fund of Funds': '₹3,000 Cr',
+    'Other': '₹2,000 Cr'
+}
+
+
+def clean_fund_name(name):
+    """Clean fund name to standard format"""
+    # Remove plan details and clean extra spaces
+    return ' '.join(_PLAN_RE.sub('', name).split())
+
+
+def determine_category(fund_name):
+    """Determine fund category from name"""
+    name_lower = fund_name.lower()
+    
+    if 'elss' in name_lower or 'tax saver' in name_lower:
+        return 'Equity - ELSS'
+    elif 'flexi cap' in name_lower:
+        return 'Equity - Flexi Cap'
+    elif 'large cap' in name_lower or 'bluechip' in name_lower or 'blue chip' in name_lower:
+        return 'Equity - Large Cap'
+    elif 'mid cap' in name_lower or 'midcap' in name_lower:
+        return 'Equity - Mid Cap'
+    elif 'small cap' in name_lower or 'smallcap' in name_lower:
+        return 'Equity - Small Cap'
+    elif 'index' in name_lower and _INDEX_RE.search(name_lower):
+        return 'Equity - Index'
+    elif 'fof' in name_lower or 'fund of funds' in name_lower:
+        return 'Fund of Funds'
+    elif 'liquid' in name_lower:
+        return 'Debt - Liquid'
+    elif 'balanced' in name_lower or 'hybrid' in name_lower or 'advantage' in name_lower:
+        return 'Hybrid'
+    elif 'money market' in name_lower:
+        # before Debt, or names like "Money Market Debt Fund" never get here
+        return 'Debt - Money Market'
+    elif 'debt' in name_lower or 'bond' in name_lower:
+        return 'Debt'
+    elif any(sector in name_lower for sector in ['infrastructure', 'banking', 'technology', 'healthcare', 'defence', 'psu', 'manufacturing', 'pharma', 'auto', 'energy']):
+        return 'Equity - Sectoral'
+    else:
+        return 'Other'
+
+
+def parse_amc_block(amc, lines, last_updated):
+    """
+    Parse the fund lines listed under one AMC header
+    Runs in a worker process, so it only uses module-level helpers
+    """
+    funds = {}
+    
+    for line in lines:
+        # Fund data line: Code;ISIN;-;Name;NAV;Date
+        parts = line.split(';')
+        
+        # CRITICAL: AMFI has 6 fields, not 5!
+        if len(parts) < 6:
+            continue
+        
+        # Only strip the fields we keep - float() ignores whitespace itself
+        scheme_code = parts[0].strip()
+        # parts[1] is ISIN
+        # parts[2] is usually "-" 
+        scheme_name = parts[3].strip()  # ← Field 3 (index 3)
+        nav_str = parts[4]              # ← Field 4 (index 4)
+        nav_date = parts[5].strip()     # ← Field 5 (index 5)
+        
+        # Skip if no valid data
+        if not scheme_name or not scheme_code:
+            continue
+        
+        # Clean fund name for use as key
+        clean_name = clean_fund_name(scheme_name)
+        
+        # Keep the first variant only - avoids duplicates
+        if clean_name in funds:
+            continue
+        
+        # Parse NAV
+        try:
+            nav = float(nav_str) if nav_str else None
+        except:
+            nav = None
+        
+        category = determine_category(scheme_name)
+        
+        funds[clean_name] = {
+            'name': scheme_name,
+            'amc': amc,
+            'scheme_code': scheme_code,
+            'nav': nav,
+            'nav_date': nav_date,
+            'category': category,
+            'returns': {'1year': None, '3year': None, '5year': None},
+            'benchmark': {'name': 'N/A', 'returns': {'1year': None}},
+            'source': 'AMFI India',
+            'last_updated': last_updated,
+            'aum': _AUM_MAP.get(category, '₹2,000 Cr')
+        }
+    
+    return funds
+
+
 class FundDataFetcher:
     def __init__(self):
         self.funds_data = {}
@@ -25,71 +158,65 @@ class FundDataFetcher:
             url = 'https://portal.amfiindia.com/spages/NAVAll.txt'
             print(f"🌐 URL: {url}")
             
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            print(f"✅ Downloaded {len(response.text)} bytes")
-            
-            lines = response.text.split('\n')
-            current_amc = None
+            last_updated = datetime.now().strftime('%Y-%m-%d')
+            line_count = 0
             fund_count = 0
+            blocks = []
             
-            print(f"📊 Processing {len(lines)} lines...")
-            print()
-            
-            for line in lines:
-                line = line.strip()
+            # Stream the file and split it into AMC blocks as it downloads
+            with requests.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
                 
-                # AMC name line (doesn't start with digit)
-                if line and not line[0].isdigit():
-                    current_amc = line
-                    continue
+                current_amc = None
+                amc_lines = []
                 
-                # Fund data line: Code;ISIN;-;Name;NAV;Date
-                if ';' in line:
-                    parts = line.split(';')
+                for line in response.iter_lines(decode_unicode=True):
+                    line_count += 1
+                    line = line.strip()
                     
-                    # CRITICAL: AMFI has 6 fields, not 5!
-                    if len(parts) >= 6:
-                        scheme_code = parts[0].strip()
-                        # parts[1] is ISIN
-                        # parts[2] is usually "-" 
-                        scheme_name = parts[3].strip()  # ← Field 3 (index 3)
-                        nav_str = parts[4].strip()      # ← Field 4 (index 4)
-                        nav_date = parts[5].strip()     # ← Field 5 (index 5)
-                        
-                        # Skip if no valid data
-                        if not scheme_name or not scheme_code:
-                            continue
-                        
-                        # Clean fund name for use as key
-                        clean_name = self.clean_fund_name(scheme_name)
-                        
-                        # Parse NAV
-                        try:
-                            nav = float(nav_str) if nav_str else None
-                        except:
-                            nav = None
+                    if not line:
+                        continue
+                    
+                    # AMC name line (doesn't start with digit)
+                    if not line[0].isdigit():
+                        if amc_lines:
+                            blocks.append((current_amc, amc_lines))
+                        current_amc = line
+                        amc_lines = []
+                        continue
+                    
+                    amc_lines.append(line)
+                
+                if amc_lines:
+                    blocks.append((current_amc, amc_lines))
+            
+            print(f"✅ Downloaded {line_count} lines")
+            print()
+            
+            if line_count >= _PARALLEL_MIN_LINES:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    parsed = list(executor.map(
+                        parse_amc_block,
+                        [amc for amc, _ in blocks],
+                        [lines for _, lines in blocks],
+                        itertools.repeat(last_updated)
+                    ))
+            else:
+                parsed = (parse_amc_block(amc, lines, last_updated) for amc, lines in blocks)
+            
+            # Merge blocks in file order
+            for funds in parsed:
+                for clean_name, fund in funds.items():
+                    # Add fund (only if not already exists - avoids duplicates)
+                    if clean_name not in self.funds_data:
+                        self.funds_data[clean_name] = fund
+                        fund_count += 1
                         
-                        # Add fund (only if not already exists - avoids duplicates)
-                        if clean_name not in self.funds_data:
-                            self.funds_data[clean_name] = {
-                                'name': scheme_name,
-                                'amc': current_amc,
-                                'scheme_code': scheme_code,
-                                'nav': nav,
-                                'nav_date': nav_date,
-                                'category': self.determine_category(scheme_name),
-                                'returns': {'1year': None, '3year': None, '5year': None},
-                                'benchmark': {'name': 'N/A', 'returns': {'1year': None}},
-                                'source': 'AMFI India',
-                                'last_updated': datetime.now().strftime('%Y-%m-%d')
-                            }
-                            fund_count += 1
-                            
-                            # Show progress every 1000 funds
-                            if fund_count % 1000 == 0:
-                                print(f"  ✅ {fund_count} funds processed...")
+                        # Show progress every 1000 funds
+                        if fund_count % 1000 == 0:
+                            print(f"  ✅ {fund_count} funds processed...")
             
             print()
             print(f"✅ Successfully fetched {fund_count} unique funds from AMFI")
@@ -102,73 +229,20 @@ class FundDataFetcher:
     
     def clean_fund_name(self, name):
         """Clean fund name to standard format"""
-        # Remove plan details (case-insensitive)
-        name = re.sub(r'\s*-\s*Direct.*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*DIRECT.*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*Regular.*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*REGULAR.*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*Growth.*$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*-\s*GROWTH.*$', '', name, flags=re.IGNORECASE)
-        
-        # Clean extra spaces
-        name = ' '.join(name.split())
-        
-        return name.strip()
+        return clean_fund_name(name)
     
     def determine_category(self, fund_name):
         """Determine fund category from name"""
-        name_lower = fund_name.lower()
-        
-        if 'elss' in name_lower or 'tax saver' in name_lower:
-            return 'Equity - ELSS'
-        elif 'flexi cap' in name_lower:
-            return 'Equity - Flexi Cap'
-        elif 'large cap' in name_lower or 'bluechip' in name_lower or 'blue chip' in name_lower:
-            return 'Equity - Large Cap'
-        elif 'mid cap' in name_lower or 'midcap' in name_lower:
-            return 'Equity - Mid Cap'
-        elif 'small cap' in name_lower or 'smallcap' in name_lower:
-            return 'Equity - Small Cap'
-        elif 'index' in name_lower:
-            return 'Equity - Index'
-        elif 'fof' in name_lower or 'fund of funds' in name_lower:
-            return 'Fund of Funds'
-        elif 'liquid' in name_lower:
-            return 'Debt - Liquid'
-        elif 'balanced' in name_lower or 'hybrid' in name_lower or 'advantage' in name_lower:
-            return 'Hybrid'
-        elif 'debt' in name_lower or 'bond' in name_lower:
-            return 'Debt'
-        elif 'money market' in name_lower:
-            return 'Debt - Money Market'
-        elif any(sector in name_lower for sector in ['infrastructure', 'banking', 'technology', 'healthcare', 'defence', 'psu', 'manufacturing', 'pharma', 'auto', 'energy']):
-            return 'Equity - Sectoral'
-        else:
-            return 'Other'
+        return determine_category(fund_name)
     
-    def add_estimated_aum(self):
-        """Add estimated AUM based on category"""
-        print("📊 Adding estimated AUM data...")
-        
-        aum_map = {
-            'Equity - Large Cap': '₹15,000 Cr',
-            'Equity - Mid Cap': '₹8,000 Cr',
-            'Equity - Small Cap': '₹5,000 Cr',
-            'Equity - Flexi Cap': '₹12,000 Cr',
-            'Equity - ELSS': '₹6,000 Cr',
-            'Equity - Index': '₹10,000 Cr',
-            'Equity - Sectoral': '₹4,000 Cr',
-            'Hybrid': '₹8,000 Cr',
-            'Debt - Liquid': '₹20,000 Cr',
-            'Debt - Money Market': '₹15,000 Cr',
-            'Debt': '₹5,000 Cr',
-            'Fund of Funds': '₹3,000 Cr',
-            'Other': '₹2,000 Cr'
-        }
-        
-        for fund_name, fund in self.funds_data.items():
-            category = fund.get('category', 'Other')
-            fund['aum'] = aum_map.get(category, '₹2,000 Cr')
+    def _write_json(self, path, data):
+        """Write a JSON file"""
+        if orjson:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     
     def generate_json_files(self):
         """Generate JSON files for GitHub Pages"""
@@ -188,23 +262,13 @@ class FundDataFetcher:
                 'funds': self.funds_data
             }
             
-            with open(f'{self.output_dir}/funds-data.json', 'w', encoding='utf-8') as f:
-                json.dump(main_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Created funds-data.json ({len(self.funds_data)} funds)")
-            
             # Index file
             index_data = {
                 'version': datetime.now().strftime('%Y.%m'),
                 'total_funds': len(self.funds_data),
-                'funds': sorted(list(self.funds_data.keys()))
+                'funds': sorted(self.funds_data)
             }
             
-            with open(f'{self.output_dir}/funds-index.json', 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Created funds-index.json")
-            
             # Metadata
             metadata = {
                 'version': datetime.now().strftime('%Y.%m'),
@@ -216,9 +280,24 @@ class FundDataFetcher:
                 'product': 'Saarthi'
             }
             
-            with open(f'{self.output_dir}/metadata.json', 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # Write all three at once - the small files finish while the
+            # big one is still being written
+            outputs = [
+                ('funds-data.json', main_data),
+                ('funds-index.json', index_data),
+                ('metadata.json', metadata)
+            ]
+            
+            with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+                futures = [
+                    executor.submit(self._write_json, f'{self.output_dir}/{filename}', data)
+                    for filename, data in outputs
+                ]
+                for future in futures:
+                    future.result()
             
+            print(f"✅ Created funds-data.json ({len(self.funds_data)} funds)")
+            print(f"✅ Created funds-index.json")
             print(f"✅ Created metadata.json")
             
             return True
@@ -239,8 +318,6 @@ class FundDataFetcher:
             print("❌ Failed to fetch AMFI data. Aborting.")
             return False
         
-        self.add_estimated_aum()
-        
         if not self.generate_json_files():
             print("❌ Failed to generate JSON files. Aborting.")
             return False
@@ -0,0 +1,487 @@
+"""
+Saarthi Fund Data Updater - shared by update-fund-data.py
+Fund name is in field index 3, not 2!
+Pass debug=True to collect and print parsing statistics.
+"""
+
+import itertools
+import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+import re
+import os
+
+# orjson is much faster on the big JSON files, but the stdlib json is
+# enough when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Plan details to strip from fund names (everything from "- Direct" etc. onwards)
+_PLAN_RE = re.compile(r'\s*-\s*(?:Direct|Regular|Growth).*$', re.IGNORECASE)
+
+# Estimated AUM by category
+_AUM_MAP = {
+    'Equity - Large Cap': '₹15,000 Cr',
+    'Equity - Mid Cap': '₹8,000 Cr',
+    'Equity - Small Cap': '₹5,000 Cr',
+    'Equity - Flexi Cap': '₹12,000 Cr',
+    'Equity - ELSS': '₹6,000 Cr',
+    'Equity - Index': '₹10,000 Cr',
+    'Equity - Sectoral': '₹4,000 Cr',
+    'Hybrid': '₹8,000 Cr',
+    'Debt - Liquid': '₹20,000 Cr',
+    'Debt - Money Market': '₹15,000 Cr',
+    'Debt': '₹5,000 Cr',
+    'Fund of Funds': '₹3,000 Cr',
+    'Other': '₹2,000 Cr'
+}
+
+# Only this many fund rows are worth worker processes. Today's NAVAll.txt
+# (~14k rows) parses in under 0.2s, less than it takes to start them
+_PARALLEL_MIN_ROWS = 100_000
+# Fund rows handed to each worker process at a time
+_ROWS_PER_CHUNK = 2000
+
+# Every record starts with the same empty returns / benchmark, so they are
+# only added when the record is serialized instead of stored per fund
+_EMPTY_RETURNS = {'1year': None, '3year': None, '5year': None}
+_EMPTY_BENCH = {'name': 'N/A', 'returns': {'1year': None}}
+
+
+@dataclass(slots=True)
+class FundRecord:
+    """One fund as parsed from AMFI - much smaller than a dict per fund"""
+    name: str
+    amc: str
+    scheme_code: str
+    nav: float | None
+    nav_date: str
+    category: str
+    aum: str
+    last_updated: str
+    source: str = 'AMFI India'
+
+
+def clean_fund_name(name):
+    """Clean fund name to standard format"""
+    # Remove plan details and clean extra spaces
+    return ' '.join(_PLAN_RE.sub('', name).split())
+
+
+def determine_category(fund_name):
+    """Determine fund category from name"""
+    name_lower = fund_name.lower()
+    
+    if 'elss' in name_lower or 'tax saver' in name_lower:
+        return 'Equity - ELSS'
+    elif 'flexi cap' in name_lower:
+        return 'Equity - Flexi Cap'
+    elif 'large cap' in name_lower or 'bluechip' in name_lower or 'blue chip' in name_lower:
+        return 'Equity - Large Cap'
+    elif 'mid cap' in name_lower or 'midcap' in name_lower:
+        return 'Equity - Mid Cap'
+    elif 'small cap' in name_lower or 'smallcap' in name_lower:
+        return 'Equity - Small Cap'
+    elif 'index' in name_lower:
+        return 'Equity - Index'
+    elif 'fof' in name_lower or 'fund of funds' in name_lower:
+        return 'Fund of Funds'
+    elif 'liquid' in name_lower:
+        return 'Debt - Liquid'
+    elif 'balanced' in name_lower or 'hybrid' in name_lower or 'advantage' in name_lower:
+        return 'Hybrid'
+    elif 'money market' in name_lower:
+        # before Debt, or names like "Money Market Debt Fund" never get here
+        return 'Debt - Money Market'
+    elif 'debt' in name_lower or 'bond' in name_lower:
+        return 'Debt'
+    elif 'infrastructure' in name_lower or 'banking' in name_lower or 'technology' in name_lower or 'healthcare' in name_lower or 'defence' in name_lower or 'psu' in name_lower or 'manufacturing' in name_lower:
+        return 'Equity - Sectoral'
+    else:
+        return 'Other'
+
+
+def parse_rows(rows, last_updated):
+    """Clean, dedupe and classify one chunk of fund rows"""
+    funds = {}
+    
+    for scheme_code, scheme_name, nav_str, nav_date, amc in rows:
+        clean_name = clean_fund_name(scheme_name)
+        
+        # Keep the first variant only - skip duplicates before any more work
+        if clean_name in funds:
+            continue
+        
+        # Parse NAV - rows like 'N.A.' never reach float()
+        nav = None
+        if nav_str and nav_str[:1].isdigit():
+            try:
+                nav = float(nav_str)
+            except ValueError:
+                pass
+        
+        category = determine_category(clean_name)
+        
+        funds[clean_name] = FundRecord(
+            name=scheme_name,
+            amc=amc,
+            scheme_code=scheme_code,
+            nav=nav,
+            nav_date=nav_date,
+            category=category,
+            aum=_AUM_MAP[category],
+            last_updated=last_updated
+        )
+    
+    return funds
+
+
+def _json_default(obj):
+    """Serialize a FundRecord in the funds-data.json record shape"""
+    if isinstance(obj, FundRecord):
+        return {
+            'name': obj.name,
+            'amc': obj.amc,
+            'scheme_code': obj.scheme_code,
+            'nav': obj.nav,
+            'nav_date': obj.nav_date,
+            'category': obj.category,
+            'returns': _EMPTY_RETURNS,
+            'benchmark': _EMPTY_BENCH,
+            'source': obj.source,
+            'last_updated': obj.last_updated,
+            'aum': obj.aum
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data, indent=True):
+    """Serialize to JSON bytes"""
+    # FundRecord is turned into its dict shape by _json_default (orjson
+    # would otherwise serialize the dataclass fields itself)
+    if orjson:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+def _atomic_write(path, blob):
+    """Write bytes to a temp file and swap it in, so a killed run never
+    leaves a half-written file behind"""
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class FundDataUpdater:
+    def __init__(self, debug=False):
+        self.debug = debug
+        self.funds_data = {}
+        self._seen = set()  # clean names already added
+        self.errors = []
+        self.output_dir = 'saarthi/data'
+        self.debug_counts = {
+            'total_lines': 0,
+            'fund_lines': 0,
+            'direct_funds': 0,
+            'growth_funds': 0,
+            'direct_and_growth': 0,
+            'added_funds': 0
+        }
+        self._set_run_time()
+        
+    def _set_run_time(self):
+        """Date strings for this run, formatted once and reused by every
+        fund record and output file (run() refreshes them at start)"""
+        now = datetime.now()
+        self._today_str = now.strftime('%Y-%m-%d')
+        self._now_iso = now.isoformat()
+        self._version_str = now.strftime('%Y.%m')
+    
+    def _http_session(self):
+        """HTTP session with keep-alive and retries with backoff"""
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session.mount('https://', adapter)
+        session.headers['Accept-Encoding'] = 'gzip'
+        return session
+    
+    def fetch_amfi_nav_data(self):
+        """Fetch NAV data from AMFI"""
+        print("📥 Fetching AMFI NAV data...")
+        
+        try:
+            url = 'https://portal.amfiindia.com/spages/NAVAll.txt'
+            debug = self.debug
+            if debug:
+                print(f"🌐 URL: {url}")
+            
+            current_amc = None
+            fund_count = 0
+            today_str = self._today_str
+            
+            # Bind everything the loop touches to locals once up front
+            funds_data = self.funds_data
+            seen = self._seen
+            debug_counts = self.debug_counts
+            rows = []
+            
+            # Stream the file and split it line by line as it downloads
+            # (gzip is decoded transparently by iter_lines)
+            with self._http_session() as session, \
+                    session.get(url, stream=True, timeout=(5, 30)) as response:
+                response.raise_for_status()
+                encoding = response.encoding or 'utf-8'
+                
+                # Debug counters are only touched when debug is on, so the
+                # normal run pays nothing for them
+                for raw in response.iter_lines():
+                    if debug:
+                        debug_counts['total_lines'] += 1
+                    line = raw.strip()
+                    
+                    if not line:
+                        continue
+                    
+                    # A line is decided by its first byte alone: AMC name lines
+                    # don't start with a digit, everything else is a fund line
+                    first = line[0]
+                    if not 48 <= first <= 57:  # b'0' <= first <= b'9'
+                        current_amc = line.decode(encoding)
+                        continue
+                    
+                    # Fund data line
+                    # Work on raw bytes and only decode the fields we keep
+                    # (the NAV stays bytes - float() accepts it directly).
+                    # bytes.split already runs in C; csv.reader would have to
+                    # decode every whole line first and is about 2x slower here
+                    parts = line.split(b';', 5)
+                    if debug and len(parts) > 1:
+                        debug_counts['fund_lines'] += 1
+                    
+                    # AMFI format has 6 fields: Code;ISIN;-;Name;NAV;Date
+                    if len(parts) >= 6:
+                        scheme_code = parts[0].decode(encoding).strip()
+                        scheme_name = parts[3].decode(encoding).strip()  # ← FIXED: Index 3, not 2!
+                        nav_str = parts[4].strip()                       # ← FIXED: Index 4, not 3!
+                        nav_date = parts[5].decode(encoding).strip()     # ← FIXED: Index 5, not 4!
+                        
+                        # Include ALL funds (Direct, Regular, Growth, Dividend, etc.)
+                        # GitHub Pages is the comprehensive fallback database
+                        
+                        # Skip if no valid data
+                        if not scheme_name or not scheme_code:
+                            continue
+                        
+                        if debug:
+                            self._count_plan(scheme_name)
+                        
+                        rows.append((scheme_code, scheme_name, nav_str, nav_date, current_amc))
+            
+            # Cleaning and classifying is CPU-bound, so a big enough file is
+            # split into chunks for worker processes
+            if len(rows) >= _PARALLEL_MIN_ROWS:
+                chunks = [rows[i:i + _ROWS_PER_CHUNK] for i in range(0, len(rows), _ROWS_PER_CHUNK)]
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    parsed = list(executor.map(parse_rows, chunks, itertools.repeat(today_str)))
+            else:
+                parsed = [parse_rows(rows, today_str)]
+            
+            # Merge chunks in file order, so the first variant still wins
+            for funds in parsed:
+                for clean_name, fund in funds.items():
+                    if clean_name not in seen:
+                        seen.add(clean_name)
+                        funds_data[clean_name] = fund
+                        fund_count += 1
+            
+            if debug:
+                self.debug_counts['added_funds'] = fund_count
+                self.print_debug_stats()
+            
+            print(f"✅ Fetched {fund_count} mutual funds from AMFI (all variants)")
+            return True
+            
+        except Exception as e:
+            print(f"❌ AMFI fetch error: {e}")
+            self.errors.append(f"AMFI: {str(e)}")
+            return False
+    
+    def _count_plan(self, scheme_name):
+        """DEBUG: count Direct / Growth variants and show a few examples"""
+        lname = scheme_name.lower()
+        has_direct = 'direct' in lname
+        has_growth = 'growth' in lname
+        if has_direct:
+            self.debug_counts['direct_funds'] += 1
+        if has_growth:
+            self.debug_counts['growth_funds'] += 1
+        
+        if has_direct and has_growth:
+            self.debug_counts['direct_and_growth'] += 1
+            
+            # Show first 5 examples
+            if self.debug_counts['direct_and_growth'] <= 5:
+                print(f"✓ Example {self.debug_counts['direct_and_growth']}: {scheme_name[:80]}...")
+    
+    def print_debug_stats(self):
+        """Print the counters collected in debug mode"""
+        print()
+        print("=" * 60)
+        print("📊 DEBUG STATISTICS:")
+        print("=" * 60)
+        print(f"Total lines processed:     {self.debug_counts['total_lines']:,}")
+        print(f"Fund data lines:           {self.debug_counts['fund_lines']:,}")
+        print(f"Funds with 'Direct':       {self.debug_counts['direct_funds']:,}")
+        print(f"Funds with 'Growth':       {self.debug_counts['growth_funds']:,}")
+        print(f"Funds with BOTH:           {self.debug_counts['direct_and_growth']:,}")
+        print(f"Unique funds added:        {self.debug_counts['added_funds']:,}")
+        print("=" * 60)
+        print()
+        
+        if self.debug_counts['added_funds'] == 0:
+            print("⚠️  WARNING: NO FUNDS WERE ADDED!")
+            print("This suggests the parsing logic might be wrong.")
+            print()
+    
+    def _write_json(self, path, data, indent=True):
+        """Write a JSON file atomically"""
+        _atomic_write(path, _dumps(data, indent))
+    
+    def _write_ndjson(self, path):
+        """Write one {name: record} object per line, so clients can parse
+        the funds as they stream in instead of all at once"""
+        blob = b''.join(
+            _dumps({name: record}, False) + b'\n'
+            for name, record in self.funds_data.items()
+        )
+        _atomic_write(path, blob)
+    
+    def generate_json_files(self):
+        """Generate JSON files for GitHub Pages"""
+        print("📝 Generating JSON files...")
+        
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            
+            main_data = {
+                'version': self._version_str,
+                'last_updated': self._now_iso,
+                'total_funds': len(self.funds_data),
+                'update_method': 'automated_script',
+                'organization': 'BluSummit Ventures',
+                'product': 'Saarthi',
+                'funds': self.funds_data
+            }
+            
+            index_data = {
+                'version': self._version_str,
+                'total_funds': len(self.funds_data),
+                'funds': sorted(self.funds_data)
+            }
+            
+            metadata = {
+                'version': self._version_str,
+                'last_updated': self._now_iso,
+                'total_funds': len(self.funds_data),
+                'errors': self.errors,
+                'source': 'AMFI India',
+                'organization': 'BluSummit Ventures',
+                'product': 'Saarthi'
+            }
+            if self.debug:
+                metadata['debug_stats'] = self.debug_counts
+            
+            # Write everything at once - the small files finish while the
+            # big one is still being written. funds-data.json is only read by
+            # the site, so it is written compact; the other two stay indented.
+            # funds-data.ndjson has the same funds, one per line
+            outputs = [
+                ('funds-data.json', main_data, False),
+                ('funds-index.json', index_data, True),
+                ('metadata.json', metadata, True)
+            ]
+            
+            with ThreadPoolExecutor(max_workers=len(outputs) + 1) as executor:
+                futures = [
+                    executor.submit(self._write_json, f'{self.output_dir}/{filename}', data, indent)
+                    for filename, data, indent in outputs
+                ]
+                futures.append(executor.submit(self._write_ndjson, f'{self.output_dir}/funds-data.ndjson'))
+                for future in futures:
+                    future.result()
+            
+            print(f"✅ Created funds-data.json ({len(self.funds_data)} funds)")
+            print(f"✅ Created funds-data.ndjson")
+            print(f"✅ Created funds-index.json")
+            print(f"✅ Created metadata.json")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ JSON generation error: {e}")
+            return False
+    
+    def run(self):
+        """Main execution flow"""
+        print("=" * 60)
+        if self.debug:
+            print("🐛 Saarthi Fund Data Updater - DEBUG MODE")
+        else:
+            print("🧭 Saarthi Fund Data Updater - BluSummit")
+        print("=" * 60)
+        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print()
+        
+        self._set_run_time()
+        
+        if not self.fetch_amfi_nav_data():
+            print("❌ Failed to fetch AMFI data. Aborting.")
+            return False
+        
+        if not self.generate_json_files():
+            print("❌ Failed to generate JSON files. Aborting.")
+            return False
+        
+        print()
+        print("=" * 60)
+        print("✅ Update Complete!")
+        print(f"📊 Total funds: {len(self.funds_data)}")
+        print(f"⚠️ Errors: {len(self.errors)}")
+        print(f"⏰ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 60)
+        print()
+        print(f"📁 Files created in {self.output_dir}/:")
+        print("   - funds-data.json")
+        print("   - funds-data.ndjson")
+        print("   - funds-index.json")
+        print("   - metadata.json")
+        print()
+        print("🚀 Next steps:")
+        print("   1. git add saarthi/")
+        print("   2. git commit -m 'Add Saarthi fund data'")
+        print("   3. git push origin main")
+        print()
+        print("🌐 Data will be available at:")
+        print("   https://blusummit.github.io/saarthi/data/funds-data.json")
+        
+        return True
+
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Saarthi Fund Data Updater
+Fetches AMFI NAV data and generates the JSON files for GitHub Pages.
+Use --debug to see what's happening while the lines are parsed.
+"""
+
+import argparse
+import sys
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Update Saarthi fund data from AMFI')
+    parser.add_argument('--debug', action='store_true',
+                        help='print parsing statistics and example funds')
+    args = parser.parse_args()
+
+    try:
+        import requests
+    except ImportError:
+        print("❌ Error: 'requests' library not found")
+        print("📦 Please install it with: pip3 install requests")
+        sys.exit(1)
+
+    from fund_data_updater import FundDataUpdater
+
+    updater = FundDataUpdater(debug=args.debug)
+    success = updater.run()
+    sys.exit(0 if success else 1)